@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 
+import asyncio
 import os
-from datetime import datetime, timedelta
+import time
 
 from evals_cli.api import (
     AutoMonitorSetupClient,
@@ -35,8 +36,8 @@ def check_monitoring_status(api_key: str) -> dict:
 
 def get_metrics(api_key: str) -> dict:
     client = MetricsClient(BASE_URL, api_key)
-    from_timestamp = int((datetime.now() - timedelta(days=7)).timestamp())
-    to_timestamp = int(datetime.now().timestamp())
+    now = int(time.time())
+    from_timestamp, to_timestamp = now - 7 * 86400, now
 
     return client.get_metrics(
         from_timestamp_sec=from_timestamp,
@@ -45,21 +46,26 @@ def get_metrics(api_key: str) -> dict:
     )
 
 
-def main():
+async def run_workflow():
     org_result = create_organization()
     print("Step 1 - Organization created:", org_result)
 
     new_api_key = org_result["environments"][0]["api_key"]
 
-    setup_result = create_monitor_setup(new_api_key)
+    # Steps 2-4 only depend on the new API key, so overlap their round trips
+    setup_result, status_result, metrics_result = await asyncio.gather(
+        asyncio.to_thread(create_monitor_setup, new_api_key),
+        asyncio.to_thread(check_monitoring_status, new_api_key),
+        asyncio.to_thread(get_metrics, new_api_key),
+    )
     print("Step 2 - Monitor setup created:", setup_result)
-
-    status_result = check_monitoring_status(new_api_key)
     print("Step 3 - Monitoring status:", status_result)
-
-    metrics_result = get_metrics(new_api_key)
     print("Step 4 - Metrics:", metrics_result)
 
 
+def main():
+    asyncio.run(run_workflow())
+
+
 if __name__ == "__main__":
     main()
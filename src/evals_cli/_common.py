@@ -0,0 +1,73 @@
+"""Shared helpers for CLI commands."""
+
+import functools
+import json
+import re
+
+import click
+
+from datetime import datetime
+from .config import get_config
+
+
+@functools.lru_cache(maxsize=1)
+def get_console():
+    """Create the shared Rich console on first use, so importing the CLI stays cheap."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _get_api_client(class_name: str):
+    """Build the named API client class from the configured URL and token."""
+    config = get_config()
+    if not config["auth_token"]:
+        console = get_console()
+        console.print("[red]Error: No auth token configured.[/red]")
+        console.print("Run [cyan]evals-cli configure[/cyan] to set up authentication.")
+        raise click.Abort()
+    from . import api
+
+    return getattr(api, class_name)(config["base_url"], config["auth_token"])
+
+
+# The client class is looked up on call, so importing this module does not load the HTTP stack
+get_client = functools.partial(_get_api_client, "AutoMonitorSetupClient")
+get_monitoring_client = functools.partial(_get_api_client, "MonitoringClient")
+get_metrics_client = functools.partial(_get_api_client, "MetricsClient")
+get_organization_client = functools.partial(_get_api_client, "OrganizationClient")
+
+
+# YYYY-MM-DD with an optional HH:MM:SS, matching what the former strptime formats
+# accepted: one- or two-digit fields, and a "T" (any case) or a run of whitespace
+# as the separator (strptime treats a space in the format as \s+)
+_TS_PATTERN = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})(?:(?:[Tt]|\s+)(\d{1,2}):(\d{1,2}):(\d{1,2}))?")
+
+
+@functools.lru_cache(maxsize=64)
+def parse_timestamp(value: str) -> int:
+    """Parse timestamp from epoch seconds or ISO date string."""
+    if value.removeprefix("-").isdecimal():
+        return int(value)
+
+    match = _TS_PATTERN.fullmatch(value)
+    if match:
+        try:
+            dt = datetime(*(int(field) for field in match.groups() if field is not None))
+            return int(dt.timestamp())
+        except (ValueError, OverflowError, OSError):
+            # Well-formed but out of range, e.g. month 13 or a date before the epoch range
+            raise click.BadParameter(f"Invalid timestamp format: {value}. Use epoch seconds or YYYY-MM-DD")
+
+    # Forms int() accepts that the fast path skips (surrounding whitespace, "+", "_")
+    try:
+        return int(value)
+    except ValueError:
+        pass
+
+    raise click.BadParameter(f"Invalid timestamp format: {value}. Use epoch seconds or YYYY-MM-DD")
+
+
+def echo_json(data) -> None:
+    """Write data as plain JSON for --json output, skipping Rich highlighting."""
+    click.echo(json.dumps(data, indent=2, ensure_ascii=False))
@@ -0,0 +1,17 @@
+"""`configure` command."""
+
+import click
+
+from .config import save_config
+from ._common import get_console
+
+
+@click.command()
+@click.option("--base-url", prompt="API Base URL", default="http://localhost:8080", help="Base URL for the API")
+@click.option("--auth-token", prompt="Auth Token", hide_input=True, help="Authentication token")
+def configure(base_url: str, auth_token: str):
+    """Configure API connection settings."""
+    console = get_console()
+
+    save_config(base_url, auth_token)
+    console.print("[green]Configuration saved successfully![/green]")
@@ -0,0 +1,121 @@
+"""`demo` command."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import click
+
+from .config import get_config
+from .api import AutoMonitorSetupClient, APIError
+from ._common import get_console
+
+
+@click.command()
+@click.option("--sequential", is_flag=True, help="Issue API calls one at a time (for debugging)")
+def demo(sequential: bool):
+    """Run a demonstration of the auto-monitor-setup API routes."""
+    from rich.panel import Panel
+
+    console = get_console()
+
+    console.print(Panel("[bold]Auto-Monitor Setup API Demo[/bold]", title="Evals CLI"))
+    console.print()
+
+    config = get_config()
+
+    # Check configuration
+    if not config["auth_token"]:
+        console.print("[yellow]No auth token configured. Running in demo mode with prompts.[/yellow]")
+        base_url = click.prompt("API Base URL", default="http://localhost:8080")
+        auth_token = click.prompt("Auth Token", hide_input=True)
+    else:
+        base_url = config["base_url"]
+        auth_token = config["auth_token"]
+        console.print(f"[dim]Using configured API: {base_url}[/dim]")
+
+    client = AutoMonitorSetupClient(base_url, auth_token)
+    # Connect while the user answers the prompts below
+    client.warmup()
+
+    # Demo values (taken from the environment when set, for unattended runs)
+    entity_type = os.getenv("EVALS_DEMO_ENTITY_TYPE") or click.prompt("Entity type", default="agent")
+    entity_value = os.getenv("EVALS_DEMO_ENTITY_VALUE") or click.prompt("Entity value")
+    evaluator_id = os.getenv("EVALS_DEMO_EVALUATOR_ID") or click.prompt(
+        "Evaluator ID", default="cmf2mpzh4002401zwcz9y0gke"
+    )
+
+    # Each section is buffered and written in one go once its call returns
+    with console:
+        console.print()
+        console.rule("[bold cyan]1. CREATE - POST /v2/auto-monitor-setups[/bold cyan]")
+
+        try:
+            result = client.create(
+                entity_type=entity_type,
+                entity_value=entity_value,
+                evaluator_ids=[evaluator_id],
+            )
+            console.print("[green]Created successfully![/green]")
+            console.print_json(data=result)
+            setup_id = result.get("id")
+        except APIError as e:
+            console.print(f"[red]Failed: {e}[/red]")
+            setup_id = None
+
+    # Steps 2-5 don't depend on each other, so issue them together over the
+    # pooled session and render the results in order as they come back
+    with ThreadPoolExecutor(max_workers=1 if sequential else 4) as pool:
+        list_all = pool.submit(client.list)
+        list_filtered = pool.submit(client.list, entity_type="agent", status="pending")
+        get_created = pool.submit(client.get, setup_id) if setup_id else None
+        get_missing = pool.submit(client.get, "non-existent-id-12345")
+
+        with console:
+            console.print()
+            console.rule("[bold cyan]2. LIST - GET /v2/auto-monitor-setups[/bold cyan]")
+
+            try:
+                results = list_all.result()
+                console.print(f"[green]Found {len(results)} setup(s)[/green]")
+                console.print_json(data=results)
+            except APIError as e:
+                console.print(f"[red]Failed: {e}[/red]")
+
+        with console:
+            console.print()
+            console.rule("[bold cyan]3. LIST with filters[/bold cyan]")
+
+            try:
+                results = list_filtered.result()
+                console.print(f"[green]Found {len(results)} filtered setup(s)[/green]")
+                console.print_json(data=results)
+            except APIError as e:
+                console.print(f"[red]Failed: {e}[/red]")
+
+        if get_created:
+            with console:
+                console.print()
+                console.rule(f"[bold cyan]4. GET BY ID - GET /v2/auto-monitor-setups/{setup_id}[/bold cyan]")
+
+                try:
+                    result = get_created.result()
+                    console.print("[green]Retrieved successfully![/green]")
+                    console.print_json(data=result)
+                except APIError as e:
+                    console.print(f"[red]Failed: {e}[/red]")
+
+        with console:
+            console.print()
+            console.rule("[bold cyan]5. GET non-existent ID (404 test)[/bold cyan]")
+
+            try:
+                get_missing.result()
+                console.print("[yellow]Unexpected success[/yellow]")
+            except APIError as e:
+                if e.status_code == 404:
+                    console.print("[green]Correctly returned 404 for non-existent setup[/green]")
+                else:
+                    console.print(f"[yellow]Unexpected error: {e}[/yellow]")
+
+            console.print()
+            console.rule("[bold cyan]Demo Complete[/bold cyan]")
@@ -0,0 +1,161 @@
+"""`metrics` command group."""
+
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+import click
+
+from datetime import datetime
+from .api import APIError
+from ._common import get_console, echo_json, get_metrics_client, parse_timestamp
+
+
+def _get_metrics_by_name(client, metric_names: list, **kwargs) -> dict:
+    """Fetch one metrics page per metric name concurrently, keyed by name."""
+    with ThreadPoolExecutor(max_workers=min(len(metric_names), 8)) as pool:
+        pages = pool.map(lambda name: client.get_metrics(metric_name=name, **kwargs), metric_names)
+        return dict(zip(metric_names, pages))
+
+
+@click.group()
+def metrics():
+    """Query and analyze metrics data."""
+    pass
+
+
+@metrics.command("list")
+@click.option("--from", "from_ts", required=True, help="Start timestamp (epoch seconds or YYYY-MM-DD)")
+@click.option("--to", "to_ts", help="End timestamp (epoch seconds or YYYY-MM-DD), defaults to now")
+@click.option("--environment", "-e", multiple=True, help="Filter by environment (can specify multiple)")
+@click.option("--metric-name", "-n", multiple=True, help="Filter by metric name (can specify multiple)")
+@click.option("--metric-source", "-s", help="Filter by metric source (e.g., 'openllmetry')")
+@click.option("--sort-by", default="event_time", help="Sort field (event_time, metric_name, numeric_value)")
+@click.option("--sort-order", type=click.Choice(["ASC", "DESC"]), default="DESC", help="Sort order")
+@click.option("--limit", "-l", type=int, default=50, help="Max results per metric name (default: 50)")
+@click.option("--json", "as_json", is_flag=True, help="Output as JSON")
+def metrics_list(
+    from_ts: str,
+    to_ts: str,
+    environment: tuple,
+    metric_name: tuple,
+    metric_source: str,
+    sort_by: str,
+    sort_order: str,
+    limit: int,
+    as_json: bool,
+):
+    """List metrics with filtering and pagination.
+
+    Retrieves metrics data grouped by metric name with individual data points.
+
+    Examples:
+
+      # Get metrics from last 24 hours
+      evals-cli metrics list --from 2024-01-01
+
+      # Filter by metric name and environment
+      evals-cli metrics list --from 2024-01-01 -n llm.token.usage -e production
+
+      # Query several metric names at once (--limit applies to each name;
+      # --json prints each name's response keyed by metric name)
+      evals-cli metrics list --from 2024-01-01 -n llm.token.usage -n llm.latency
+    """
+    client = get_metrics_client()
+
+    from_timestamp = parse_timestamp(from_ts)
+    to_timestamp = parse_timestamp(to_ts) if to_ts else None
+
+    query = dict(
+        from_timestamp_sec=from_timestamp,
+        to_timestamp_sec=to_timestamp,
+        environments=list(environment) if environment else None,
+        metric_source=metric_source,
+        sort_by=sort_by,
+        sort_order=sort_order,
+        limit=limit,
+    )
+    names = list(dict.fromkeys(metric_name))
+
+    try:
+        if len(names) > 1:
+            results = _get_metrics_by_name(client, names, **query)
+        else:
+            results = {None: client.get_metrics(metric_name=names[0] if names else None, **query)}
+
+        if as_json:
+            # A single query prints the server response as-is
+            echo_json(results if len(names) > 1 else results[None])
+            return
+
+        from rich.table import Table
+        from rich.panel import Panel
+        from rich.text import Text
+
+        console = get_console()
+
+        pages = [result.get("metrics", {}) for result in results.values()]
+        data = [group for page in pages for group in page.get("data", [])]
+        total_points = sum(page.get("total_points", 0) for page in pages)
+        total_results = sum(page.get("total_results", 0) for page in pages)
+
+        if not data:
+            console.print("[yellow]No metrics found.[/yellow]")
+            return
+
+        console.print(Panel(
+            "[cyan]Metrics Results[/cyan]",
+            title="Metrics"
+        ))
+
+        for group in data:
+            metric_name_val = group.get("metric_name", "Unknown")
+            points = group.get("points", [])
+
+            console.print(Text.assemble("\n", (str(metric_name_val), "bold magenta"), f" ({len(points)} points)"))
+
+            table = Table(show_header=True)
+            table.add_column("Value", style="green")
+            table.add_column("Time", style="cyan")
+            table.add_column("Environment", style="yellow")
+            table.add_column("Trace ID", style="dim")
+
+            for point in islice(points, 10):  # Show first 10 points per metric
+                value = ""
+                if point.get("numeric_value") is not None:
+                    value = str(point["numeric_value"])
+                elif point.get("enum_value"):
+                    value = point["enum_value"]
+                elif point.get("bool_value") is not None:
+                    value = str(point["bool_value"])
+
+                event_time = point.get("event_time", 0)
+                if event_time:
+                    # Only whole seconds are shown, so drop the milliseconds with integer division
+                    dt = datetime.fromtimestamp(event_time // 1000)
+                    time_str = (
+                        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+                        f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+                    )
+                else:
+                    time_str = "N/A"
+
+                labels = point.get("labels") or {}
+                env = labels.get("environment", "N/A")
+                trace_id = labels.get("trace_id")
+                trace_id = trace_id[:12] + "..." if trace_id else "N/A"
+
+                # Text cells are rendered as-is, skipping Rich's markup parser; a null
+                # environment label stays a blank cell
+                table.add_row(Text(value), Text(time_str), Text("" if env is None else str(env)), Text(trace_id))
+
+            if len(points) > 10:
+                table.add_row(Text("...", style="dim"), Text(f"+{len(points) - 10} more", style="dim"), "", "")
+
+            console.print(table)
+
+        console.print(f"\n[dim]Showing {total_points} points from {total_results} total results[/dim]")
+
+    except APIError as e:
+        console = get_console()
+        console.print(f"[red]Error: {e}[/red]")
+        raise click.Abort()
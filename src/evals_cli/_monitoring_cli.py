@@ -0,0 +1,99 @@
+"""`monitoring` command group."""
+
+from bisect import bisect_left
+
+import click
+
+from .api import APIError
+from ._common import get_console, echo_json, get_monitoring_client
+
+_STATUS_COLORS = {"OK": "green", "DEGRADED": "yellow", "ERROR": "red"}
+
+# Upper bounds (inclusive, seconds) for green and yellow lag; anything above is red
+_LAG_THRESHOLDS = (180, 600)
+_LAG_COLORS = ("green", "yellow", "red")
+
+
+@click.group()
+def monitoring():
+    """View monitoring status and pipeline health."""
+    pass
+
+
+@monitoring.command("status")
+@click.option("--json", "as_json", is_flag=True, help="Output as JSON")
+def monitoring_status(as_json: bool):
+    """Get monitoring status for the organization.
+
+    Shows evaluation pipeline health including lag metrics and status.
+
+    Status values:
+      - OK: lag <= 3 minutes
+      - DEGRADED: 3min < lag <= 10min
+      - ERROR: lag > 10min or no evaluation data
+    """
+    client = get_monitoring_client()
+
+    try:
+        result = client.get_status()
+
+        if as_json:
+            echo_json(result)
+            return
+
+        from rich.table import Table
+        from rich.panel import Panel
+        from rich.text import Text
+
+        console = get_console()
+
+        status = result.get("status", "UNKNOWN")
+        status_color = _STATUS_COLORS.get(status, "white")
+
+        table = Table(show_header=False, box=None)
+        table.add_column("Field", style="dim")
+        table.add_column("Value")
+
+        table.add_row("Organization", result.get("organization_id", "N/A"))
+
+        environment = result.get("environment")
+        if environment:
+            table.add_row("Environment", environment)
+        project = result.get("project")
+        if project:
+            table.add_row("Project", project)
+
+        table.add_row("", "")  # Spacer
+
+        evaluated_up_to = result.get("evaluated_up_to")
+        table.add_row("Evaluated Up To", evaluated_up_to or Text("N/A", style="dim"))
+
+        latest_span = result.get("latest_span_received")
+        table.add_row("Latest Span Received", latest_span or Text("N/A", style="dim"))
+
+        table.add_row("", "")  # Spacer
+
+        lag_seconds = result.get("lag_in_seconds", 0)
+        lag_spans = result.get("lag_in_spans", 0)
+
+        lag_color = _LAG_COLORS[bisect_left(_LAG_THRESHOLDS, lag_seconds)]
+        table.add_row("Lag (seconds)", Text(str(lag_seconds), style=lag_color))
+        table.add_row("Lag (spans)", str(lag_spans))
+
+        reasons = result.get("reasons") or ()
+        if reasons:
+            table.add_row("", "")  # Spacer
+            table.add_row("Reasons", ", ".join(reasons))
+
+        # Write panel and table in a single flush
+        with console:
+            console.print(Panel(
+                Text(str(status), style=f"bold {status_color}"),
+                title="Monitoring Status"
+            ))
+            console.print(table)
+
+    except APIError as e:
+        console = get_console()
+        console.print(f"[red]Error: {e}[/red]")
+        raise click.Abort()
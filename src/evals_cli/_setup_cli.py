@@ -0,0 +1,142 @@
+"""`setup` command group."""
+
+import click
+
+from .api import APIError
+from ._common import get_console, echo_json, get_client
+
+
+@click.group()
+def setup():
+    """Manage auto-monitor-setups."""
+    pass
+
+
+@setup.command("create")
+@click.option("--entity-type", "-t", required=True, help="Entity type (e.g., 'agent')")
+@click.option("--entity-value", "-v", required=True, help="Entity value/name")
+@click.option("--evaluator-id", "-e", multiple=True, help="Evaluator ID to use (can specify multiple)")
+@click.option("--evaluator-type", "-T", multiple=True, help="Evaluator type to create (e.g., 'hallucination', 'toxicity')")
+def setup_create(entity_type: str, entity_value: str, evaluator_id: tuple, evaluator_type: tuple):
+    """Create a new auto-monitor-setup."""
+    from rich.panel import Panel
+    from rich import print_json
+
+    console = get_console()
+
+    if not evaluator_id and not evaluator_type:
+        console.print("[red]Error: Must specify at least one --evaluator-id or --evaluator-type[/red]")
+        raise click.Abort()
+
+    client = get_client()
+
+    try:
+        result = client.create(
+            entity_type=entity_type,
+            entity_value=entity_value,
+            evaluator_ids=evaluator_id or None,
+            evaluator_types=evaluator_type or None,
+        )
+        console.print(Panel("[green]Auto-monitor-setup created successfully![/green]", title="Success"))
+        print_json(data=result)
+    except APIError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise click.Abort()
+
+
+@setup.command("list")
+@click.option("--entity-type", "-t", help="Filter by entity type")
+@click.option("--status", "-s", help="Filter by status (e.g., 'pending', 'active')")
+@click.option("--json", "as_json", is_flag=True, help="Output as JSON")
+def setup_list(entity_type: str, status: str, as_json: bool):
+    """List auto-monitor-setups."""
+    client = get_client()
+
+    try:
+        results = client.list(entity_type=entity_type, status=status)
+
+        if as_json:
+            echo_json(results)
+            return
+
+        from rich.table import Table
+
+        console = get_console()
+
+        if not results:
+            console.print("[yellow]No setups found.[/yellow]")
+            return
+
+        table = Table(title="Auto-Monitor Setups")
+        table.add_column("ID", style="cyan")
+        table.add_column("Entity Type", style="magenta")
+        table.add_column("Entity Value", style="green")
+        table.add_column("Status", style="yellow")
+        table.add_column("Evaluators", style="blue")
+
+        for setup in results:
+            get = setup.get
+            evaluators = get("evaluators", [])
+            evaluator_count = len(evaluators) if isinstance(evaluators, list) else 0
+            table.add_row(
+                get("id", "N/A"),
+                get("entity_type", "N/A"),
+                get("entity_value", "N/A"),
+                get("status", "N/A"),
+                str(evaluator_count),
+            )
+
+        console.print(table)
+        console.print(f"\n[dim]Total: {len(results)} setup(s)[/dim]")
+    except APIError as e:
+        console = get_console()
+        console.print(f"[red]Error: {e}[/red]")
+        raise click.Abort()
+
+
+@setup.command("get")
+@click.argument("setup_id")
+def setup_get(setup_id: str):
+    """Get details of a specific auto-monitor-setup."""
+    from rich.panel import Panel
+    from rich import print_json
+
+    console = get_console()
+
+    client = get_client()
+
+    try:
+        result = client.get(setup_id)
+        console.print(Panel(f"[cyan]Setup: {setup_id}[/cyan]", title="Auto-Monitor Setup"))
+        print_json(data=result)
+    except APIError as e:
+        if e.status_code == 404:
+            console.print(f"[red]Error: Setup '{setup_id}' not found.[/red]")
+        else:
+            console.print(f"[red]Error: {e}[/red]")
+        raise click.Abort()
+
+
+@setup.command("delete")
+@click.argument("setup_id")
+@click.option("--yes", "-y", is_flag=True, help="Skip confirmation prompt")
+def setup_delete(setup_id: str, yes: bool):
+    """Delete an auto-monitor-setup."""
+    console = get_console()
+
+    if not yes:
+        if not click.confirm(f"Are you sure you want to delete setup '{setup_id}'?"):
+            console.print("[yellow]Cancelled.[/yellow]")
+            return
+
+    client = get_client()
+
+    try:
+        client.delete(setup_id)
+        console.print(f"[green]Setup '{setup_id}' deleted successfully.[/green]")
+    except APIError as e:
+        if e.status_code == 404:
+            console.print(f"[red]Error: Setup '{setup_id}' not found.[/red]")
+        else:
+            console.print(f"[red]Error: {e}[/red]")
+        raise click.Abort()
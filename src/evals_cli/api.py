@@ -1,10 +1,58 @@
 """API clients for evals routes."""
 
 import json
+import os
+import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
 import requests
-from typing import Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Any, Optional, Sequence
 from .config import get_headers
 
+try:
+    import orjson as _json
+except ImportError:
+    _json = json
+
+# Transient failures are retried with exponential backoff, honoring Retry-After.
+# Only idempotent methods are retried so a create is never submitted twice.
+# A refused connection is retried once at most, so a server that is down fails fast.
+_retry = Retry(
+    total=5,
+    connect=1,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(["GET", "HEAD", "DELETE"]),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+# Shared across all clients so keep-alive connections are reused between calls
+_adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=_retry)
+_session = requests.Session()
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
+# Seconds a read response stays fresh, per endpoint family
+_CACHE_POLICY = {
+    "monitoring/status": 5,
+    "auto-monitor-setups": 10,
+    "metrics": 15,
+}
+
+_MISS = object()
+
+# Requests currently on the wire, so concurrent identical GETs share one round trip.
+# Keys include the write epoch, bumped by every create/delete, so a GET started
+# after a write never joins one that was sent before it.
+_inflight: dict[tuple, Future] = {}
+_inflight_lock = threading.Lock()
+_write_epoch = 0
+
 
 class APIError(Exception):
     """Custom exception for API errors."""
@@ -15,17 +63,149 @@ class APIError(Exception):
         super().__init__(f"HTTP {status_code}: {message}")
 
 
-class MonitoringClient:
-    """Client for monitoring API routes."""
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after a per-entry TTL.
+
+    Expired entries stay around (until evicted) together with their ETag and
+    Last-Modified validators, so they can be revalidated with a conditional GET.
+    ``generation`` is bumped by every clear(), so a response fetched before a
+    clear can be told apart from one fetched after it.
+    """
+
+    def __init__(self, max_size: int = 512):
+        self.max_size = max_size
+        self.generation = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key) -> Any:
+        """Return the cached value for key, or _MISS if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() >= entry[1]:
+                return _MISS
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def get_stale(self, key) -> Optional[tuple]:
+        """Return (value, etag, last_modified) for key even if expired, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, _, etag, last_modified = entry
+            return value, etag, last_modified
+
+    def set(
+        self,
+        key,
+        value,
+        ttl: float,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        generation: Optional[int] = None,
+    ) -> None:
+        """Store value under key for ttl seconds, evicting the least recently used entry.
+
+        If generation is given and the cache has been cleared since, the value is
+        dropped: it was fetched before the write that triggered the clear.
+        """
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[key] = (value, time.monotonic() + ttl, etag, last_modified)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry and start a new generation."""
+        with self._lock:
+            self._entries.clear()
+            self.generation += 1
+
+
+# Shared by all clients and keyed by token, URL and params (like the in-flight
+# table), so a write through any client invalidates reads cached by the others
+_cache = TTLCache()
+
+
+def _cache_ttl(response: requests.Response, default: float) -> Optional[float]:
+    """TTL for a response per its Cache-Control header, or None if it must not be stored.
+
+    no-store is never cached and no-cache is stored only for revalidation (TTL 0).
+    Otherwise max-age, if present, replaces default, and the result is jittered by
+    +/-20%. "private" needs no handling: this in-process cache is keyed by auth token.
+    """
+    directives = {}
+    for directive in response.headers.get("Cache-Control", "").split(","):
+        name, _, value = directive.strip().partition("=")
+        directives[name.lower()] = value
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0.0
+    max_age = directives.get("max-age", "")
+    if max_age.isdigit():
+        default = int(max_age)
+    # Jitter so entries cached together don't all expire together
+    return default * random.uniform(0.8, 1.2)
 
-    def __init__(self, base_url: str, auth_token: str):
+
+class _BaseClient:
+    """Shared plumbing for the API route clients."""
+
+    __slots__ = ("base_url", "auth_token", "_session", "headers", "endpoint")
+
+    def __init__(
+        self,
+        base_url: str,
+        auth_token: str,
+        endpoint_suffix: str,
+        session: Optional[requests.Session] = None,
+    ):
         self.base_url = base_url.rstrip("/")
         self.auth_token = auth_token
-        self.endpoint = f"{self.base_url}/v2/monitoring"
+        self._session = session or _session
+        self.headers = get_headers(auth_token)
+        self.endpoint = f"{self.base_url}{endpoint_suffix}"
+
+    def close(self) -> None:
+        """Close the session passed in as ``session=``, if any.
+
+        Clients built without one use the module-wide shared session, which other
+        clients keep using, so it stays open for the life of the process.
+        """
+        if self._session is not _session:
+            self._session.close()
+
+    def warmup(self) -> None:
+        """Open a pooled connection in the background so the first call skips the handshake.
+
+        Set EVALS_DISABLE_WARMUP=1 to turn this off (e.g. when working offline).
+        """
+        if os.getenv("EVALS_DISABLE_WARMUP") == "1":
+            return
+
+        def _connect():
+            try:
+                self._session.head(f"{self.base_url}/", timeout=2.0)
+            except requests.RequestException:
+                pass
+
+        threading.Thread(target=_connect, daemon=True).start()
 
-    @property
-    def headers(self) -> dict:
-        return get_headers(self.auth_token)
+    def _invalidate(self) -> None:
+        """Forget cached reads after a write and retire the GETs already in flight."""
+        global _write_epoch
+        _cache.clear()
+        with _inflight_lock:
+            _write_epoch += 1
+
+    @staticmethod
+    def _decode(body: bytes) -> dict | list | None:
+        """Decode a cached response body into a fresh object for each caller."""
+        return _json.loads(body) if body else None
 
     def _handle_response(self, response: requests.Response) -> dict | list | None:
         """Handle API response and raise errors if needed."""
@@ -36,10 +216,87 @@ class MonitoringClient:
                 error_msg = response.text or "Unknown error"
             raise APIError(response.status_code, str(error_msg))
 
-        if response.text:
-            return response.json()
+        if response.content:
+            return _json.loads(response.content)
         return None
 
+    def _get(self, url: str, params: Optional[dict], policy: str) -> dict | list | None:
+        """GET url through the shared response cache; error responses raise and are never cached.
+
+        Expired entries with a validator are revalidated with If-None-Match /
+        If-Modified-Since, and a 304 reuses the cached body. Identical requests
+        already in flight (same token, URL and params, and no write since it was
+        sent) wait for that response instead of issuing their own. The raw body is
+        what gets cached and shared, so every caller gets its own decoded copy.
+        """
+        params_key = json.dumps(params, sort_keys=True)
+        key = (self.headers["Authorization"], url, params_key)
+        body = _cache.get(key)
+        if body is not _MISS:
+            return self._decode(body)
+
+        with _inflight_lock:
+            flight_key = (_write_epoch, self.headers["Authorization"], url, params_key)
+            future = _inflight.get(flight_key)
+            leader = future is None
+            if leader:
+                future = _inflight[flight_key] = Future()
+        if not leader:
+            return self._decode(future.result())
+
+        try:
+            generation = _cache.generation
+            headers = self.headers
+            stale = _cache.get_stale(key)
+            etag = last_modified = None
+            if stale is not None:
+                _, etag, last_modified = stale
+                if etag or last_modified:
+                    headers = dict(headers)
+                    if etag:
+                        headers["If-None-Match"] = etag
+                    if last_modified:
+                        headers["If-Modified-Since"] = last_modified
+
+            response = self._session.get(url, headers=headers, params=params)
+            if response.status_code == 304 and stale is not None:
+                body = stale[0]
+            else:
+                if response.status_code >= 400:
+                    self._handle_response(response)  # raises APIError
+                body = response.content
+            ttl = _cache_ttl(response, _CACHE_POLICY[policy])
+            if ttl is not None:
+                # A 304 may omit the validators and still refers to the stale body; a
+                # 200 is a new body, so only its own validators apply
+                if response.status_code != 304:
+                    etag = last_modified = None
+                _cache.set(
+                    key,
+                    body,
+                    ttl,
+                    etag=response.headers.get("ETag", etag),
+                    last_modified=response.headers.get("Last-Modified", last_modified),
+                    generation=generation,
+                )
+            future.set_result(body)
+            return self._decode(body)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _inflight_lock:
+                del _inflight[flight_key]
+
+
+class MonitoringClient(_BaseClient):
+    """Client for monitoring API routes."""
+
+    __slots__ = ()
+
+    def __init__(self, base_url: str, auth_token: str, session: Optional[requests.Session] = None):
+        super().__init__(base_url, auth_token, "/v2/monitoring", session)
+
     def get_status(self) -> dict:
         """
         Get monitoring status for the organization.
@@ -61,33 +318,16 @@ class MonitoringClient:
             Monitoring status object
         """
         url = f"{self.endpoint}/status"
-        response = requests.get(url, headers=self.headers)
-        return self._handle_response(response)
+        return self._get(url, None, "monitoring/status")
 
 
-class MetricsClient:
+class MetricsClient(_BaseClient):
     """Client for metrics API routes."""
 
-    def __init__(self, base_url: str, auth_token: str):
-        self.base_url = base_url.rstrip("/")
-        self.auth_token = auth_token
-
-    @property
-    def headers(self) -> dict:
-        return get_headers(self.auth_token)
-
-    def _handle_response(self, response: requests.Response) -> dict | list | None:
-        """Handle API response and raise errors if needed."""
-        if response.status_code >= 400:
-            try:
-                error_msg = response.json()
-            except Exception:
-                error_msg = response.text or "Unknown error"
-            raise APIError(response.status_code, str(error_msg))
+    __slots__ = ()
 
-        if response.text:
-            return response.json()
-        return None
+    def __init__(self, base_url: str, auth_token: str, session: Optional[requests.Session] = None):
+        super().__init__(base_url, auth_token, "/v2/metrics", session)
 
     def get_metrics(
         self,
@@ -122,10 +362,6 @@ class MetricsClient:
         Returns:
             Paginated metrics response with grouped data points
         """
-        import time
-
-        url = f"{self.base_url}/v2/metrics"
-
         params = {
             "from_timestamp_sec": from_timestamp_sec,
             "to_timestamp_sec": to_timestamp_sec or int(time.time()),
@@ -148,34 +384,16 @@ class MetricsClient:
             # Filters need to be JSON-encoded as a string
             params["filters"] = json.dumps(filters)
 
-        response = requests.get(url, headers=self.headers, params=params)
-        return self._handle_response(response)
+        return self._get(self.endpoint, params, "metrics")
 
 
-class OrganizationClient:
+class OrganizationClient(_BaseClient):
     """Client for organization API routes."""
 
-    def __init__(self, base_url: str, auth_token: str):
-        self.base_url = base_url.rstrip("/")
-        self.auth_token = auth_token
-        self.endpoint = f"{self.base_url}/v2/organizations"
-
-    @property
-    def headers(self) -> dict:
-        return get_headers(self.auth_token)
+    __slots__ = ()
 
-    def _handle_response(self, response: requests.Response) -> dict | list | None:
-        """Handle API response and raise errors if needed."""
-        if response.status_code >= 400:
-            try:
-                error_msg = response.json()
-            except Exception:
-                error_msg = response.text or "Unknown error"
-            raise APIError(response.status_code, str(error_msg))
-
-        if response.text:
-            return response.json()
-        return None
+    def __init__(self, base_url: str, auth_token: str, session: Optional[requests.Session] = None):
+        super().__init__(base_url, auth_token, "/v2/organizations", session)
 
     def create(
         self,
@@ -207,41 +425,24 @@ class OrganizationClient:
         if environments:
             payload["envs"] = environments
 
-        response = requests.post(self.endpoint, headers=self.headers, json=payload)
+        response = self._session.post(self.endpoint, headers=self.headers, data=_json.dumps(payload))
         return self._handle_response(response)
 
 
-class AutoMonitorSetupClient:
+class AutoMonitorSetupClient(_BaseClient):
     """Client for auto-monitor-setup API routes."""
 
-    def __init__(self, base_url: str, auth_token: str):
-        self.base_url = base_url.rstrip("/")
-        self.auth_token = auth_token
-        self.endpoint = f"{self.base_url}/v2/auto-monitor-setups"
+    __slots__ = ()
 
-    @property
-    def headers(self) -> dict:
-        return get_headers(self.auth_token)
-
-    def _handle_response(self, response: requests.Response) -> dict | list | None:
-        """Handle API response and raise errors if needed."""
-        if response.status_code >= 400:
-            try:
-                error_msg = response.json()
-            except Exception:
-                error_msg = response.text or "Unknown error"
-            raise APIError(response.status_code, str(error_msg))
-
-        if response.text:
-            return response.json()
-        return None
+    def __init__(self, base_url: str, auth_token: str, session: Optional[requests.Session] = None):
+        super().__init__(base_url, auth_token, "/v2/auto-monitor-setups", session)
 
     def create(
         self,
         entity_type: str,
         entity_value: str,
-        evaluator_ids: Optional[list[str]] = None,
-        evaluator_types: Optional[list[str]] = None,
+        evaluator_ids: Optional[Sequence[str]] = None,
+        evaluator_types: Optional[Sequence[str]] = None,
     ) -> dict:
         """
         Create a new auto-monitor-setup.
@@ -271,7 +472,8 @@ class AutoMonitorSetupClient:
             "evaluators": evaluators,
         }
 
-        response = requests.post(self.endpoint, headers=self.headers, json=payload)
+        response = self._session.post(self.endpoint, headers=self.headers, data=_json.dumps(payload))
+        self._invalidate()
         return self._handle_response(response)
 
     def list(
@@ -295,8 +497,7 @@ class AutoMonitorSetupClient:
         if status:
             params["status"] = status
 
-        response = requests.get(self.endpoint, headers=self.headers, params=params)
-        return self._handle_response(response)
+        return self._get(self.endpoint, params, "auto-monitor-setups")
 
     def get(self, setup_id: str) -> dict:
         """
@@ -309,8 +510,7 @@ class AutoMonitorSetupClient:
             Setup object
         """
         url = f"{self.endpoint}/{setup_id}"
-        response = requests.get(url, headers=self.headers)
-        return self._handle_response(response)
+        return self._get(url, None, "auto-monitor-setups")
 
     def delete(self, setup_id: str) -> None:
         """
@@ -320,5 +520,6 @@ class AutoMonitorSetupClient:
             setup_id: The ID of the setup to delete
         """
         url = f"{self.endpoint}/{setup_id}"
-        response = requests.delete(url, headers=self.headers)
+        response = self._session.delete(url, headers=self.headers)
+        self._invalidate()
         self._handle_response(response)
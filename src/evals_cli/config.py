@@ -1,32 +1,40 @@
 """Configuration management for the CLI."""
 
+import functools
 import os
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
 from dotenv import load_dotenv
 
-# Load .env file if it exists
-load_dotenv()
-
 CONFIG_FILE = Path.home() / ".evals-cli" / "config"
 
 
+@functools.lru_cache(maxsize=1)
+def _load_config_file() -> dict[str, str]:
+    """Read key=value pairs from the config file, once per process."""
+    text = CONFIG_FILE.read_text() if CONFIG_FILE.exists() else ""
+    return dict(line.strip().split("=", 1) for line in text.splitlines() if "=" in line)
+
+
+@functools.lru_cache(maxsize=1)
 def get_config() -> dict:
-    """Get configuration from environment or config file."""
+    """Get configuration from environment or config file (cached per process)."""
+    # Load .env file if it exists; deferred to first use so --help does no file I/O
+    load_dotenv()
+
     config = {
         "base_url": os.getenv("EVALS_API_BASE_URL", "http://localhost:8080"),
         "auth_token": os.getenv("EVALS_API_AUTH_TOKEN", ""),
     }
 
-    # Try to load from config file if env vars not set
-    if CONFIG_FILE.exists() and not config["auth_token"]:
-        with open(CONFIG_FILE) as f:
-            for line in f:
-                if "=" in line:
-                    key, value = line.strip().split("=", 1)
-                    if key == "base_url" and not os.getenv("EVALS_API_BASE_URL"):
-                        config["base_url"] = value
-                    elif key == "auth_token":
-                        config["auth_token"] = value
+    # Fall back to the config file if env vars not set
+    if not config["auth_token"]:
+        file_config = _load_config_file()
+        if "base_url" in file_config and not os.getenv("EVALS_API_BASE_URL"):
+            config["base_url"] = file_config["base_url"]
+        if "auth_token" in file_config:
+            config["auth_token"] = file_config["auth_token"]
 
     return config
 
@@ -37,11 +45,14 @@ def save_config(base_url: str, auth_token: str) -> None:
     with open(CONFIG_FILE, "w") as f:
         f.write(f"base_url={base_url}\n")
         f.write(f"auth_token={auth_token}\n")
+    _load_config_file.cache_clear()
+    get_config.cache_clear()
 
 
-def get_headers(auth_token: str) -> dict:
-    """Get headers for API requests."""
-    return {
+@functools.lru_cache(maxsize=32)
+def get_headers(auth_token: str) -> Mapping[str, str]:
+    """Get headers for API requests (cached per token, read-only)."""
+    return MappingProxyType({
         "Authorization": auth_token if auth_token.startswith("Bearer ") else f"Bearer {auth_token}",
         "Content-Type": "application/json",
-    }
+    })